@@ -915,8 +915,8 @@ class LinearGrid(_Grid):
         dt = dt.flatten()
         dz = dz.flatten()
 
-        nodes = np.stack([r, t, z]).T
-        spacing = np.stack([dr, dt, dz]).T
+        nodes = np.column_stack([r, t, z])
+        spacing = np.column_stack([dr, dt, dz])
 
         return nodes, spacing
 
@@ -1053,8 +1053,8 @@ class QuadratureGrid(_Grid):
         dt = dt.flatten()
         dz = dz.flatten()
 
-        nodes = np.stack([r, t, z]).T
-        spacing = np.stack([dr, dt, dz]).T
+        nodes = np.column_stack([r, t, z])
+        spacing = np.column_stack([dr, dt, dz])
 
         return nodes, spacing
 
@@ -1257,8 +1257,8 @@ class ConcentricGrid(_Grid):
         dr = np.tile(dr, 2 * N + 1)
         dt = np.tile(dt, 2 * N + 1)
         dz = np.ones_like(z) * dz
-        nodes = np.stack([r, t, z]).T
-        spacing = np.stack([dr, dt, dz]).T
+        nodes = np.column_stack([r, t, z])
+        spacing = np.column_stack([dr, dt, dz])
 
         return nodes, spacing
 
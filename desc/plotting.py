@@ -14,12 +14,13 @@ from pylatexenc.latex2text import LatexNodes2Text
 from termcolor import colored
 
 from desc.backend import sign
-from desc.basis import fourier, zernike_radial_poly
+from desc.basis import DoubleFourierSeries, fourier, zernike_radial_poly
 from desc.coils import CoilSet
 from desc.compute import data_index, get_transforms
 from desc.compute.utils import _parse_parameterization, surface_averages_map
 from desc.equilibrium.coords import map_coordinates
 from desc.grid import Grid, LinearGrid
+from desc.transform import Transform
 from desc.utils import errorif, only1, parse_argname_change, setdefault
 from desc.vmec_utils import ptolemy_linear_transform
 
@@ -130,7 +131,7 @@ def _format_ax(ax, is3d=False, rows=1, cols=1, figsize=None, equal=False):
     Parameters
     ----------
     ax : None or matplotlib AxesSubplot instance
-        Axis to plot to.
+        Axis to plot to. If given, its parent figure is returned.
     is3d: bool
         Whether the plot is three-dimensional.
     rows : int, optional
@@ -180,11 +181,11 @@ def _format_ax(ax, is3d=False, rows=1, cols=1, figsize=None, equal=False):
             return fig, ax
 
     elif isinstance(ax, matplotlib.axes.Axes):
-        return plt.gcf(), ax
+        return ax.get_figure(), ax
     else:
         ax = np.atleast_1d(ax)
         if isinstance(ax.flatten()[0], matplotlib.axes.Axes):
-            return plt.gcf(), ax
+            return ax.flatten()[0].get_figure(), ax
         else:
             raise TypeError(
                 colored(
@@ -253,7 +254,7 @@ def _get_plot_axes(grid):
     return tuple(plot_axes)
 
 
-def _compute(eq, name, grid, component=None, reshape=True):
+def _compute(eq, name, grid, component=None, reshape=True, norm_name=None):
     """Compute quantity specified by name on grid for Equilibrium eq.
 
     Parameters
@@ -266,11 +267,19 @@ def _compute(eq, name, grid, component=None, reshape=True):
         Grid of coordinates to evaluate at.
     component : str, optional
         For vector variables, which element to plot. Default is the norm of the vector.
+    norm_name : str, optional
+        Name of quantity to normalize by. It is computed in the same call as ``name``
+        so that the transforms on ``grid`` are only built once.
 
     Returns
     -------
     data : float array of shape (M, L, N)
         Computed quantity.
+    label : str
+        Label for the computed quantity.
+    normalization : float
+        Mean absolute value of ``norm_name`` that data was divided by, or 1 if
+        ``norm_name`` is not given.
 
     """
     parameterization = _parse_parameterization(eq)
@@ -279,6 +288,11 @@ def _compute(eq, name, grid, component=None, reshape=True):
             f"Unrecognized value '{name}' for "
             + f"parameterization {parameterization}."
         )
+    if norm_name is not None and norm_name not in data_index[parameterization]:
+        raise ValueError(
+            f"Unrecognized value '{norm_name}' for "
+            + f"parameterization {parameterization}."
+        )
     assert component in [
         None,
         "R",
@@ -290,9 +304,17 @@ def _compute(eq, name, grid, component=None, reshape=True):
 
     label = data_index[parameterization][name]["label"]
 
+    names = [name] if norm_name is None else [name, norm_name]
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
-        data = eq.compute(name, grid=grid)[name]
+        data = eq.compute(names, grid=grid)
+    normalization = 1
+    if norm_name is not None:
+        norm_data = data[norm_name]
+        if data_index[parameterization][norm_name]["dim"] > 1:
+            norm_data = np.linalg.norm(norm_data, axis=-1)
+        normalization = np.nanmean(np.abs(norm_data))
+    data = data[name]
 
     if data_index[parameterization][name]["dim"] > 1:
         if component is None:
@@ -311,7 +333,7 @@ def _compute(eq, name, grid, component=None, reshape=True):
     if reshape:
         data = data.reshape((grid.num_theta, grid.num_rho, grid.num_zeta), order="F")
 
-    return data, label
+    return data / normalization, label, normalization
 
 
 def plot_coefficients(eq, L=True, M=True, N=True, ax=None, **kwargs):
@@ -511,7 +533,7 @@ def plot_1d(eq, name, grid=None, log=False, ax=None, return_data=False, **kwargs
     if len(plot_axes) != 1:
         return ValueError(colored("Grid must be 1D", "red"))
 
-    data, ylabel = _compute(eq, name, grid, kwargs.pop("component", None))
+    data, ylabel, _ = _compute(eq, name, grid, kwargs.pop("component", None))
     label = kwargs.pop("label", None)
 
     fig, ax = _format_ax(ax, figsize=kwargs.pop("figsize", None))
@@ -630,12 +652,15 @@ def plot_2d(
     if len(plot_axes) != 2:
         return ValueError(colored("Grid must be 2D", "red"))
     component = kwargs.pop("component", None)
+    # normalize force by B pressure gradient
+    norm_name = kwargs.pop("norm_name", "<|grad(|B|^2)|/2mu0>_vol") if norm_F else None
     if name != "B*n":
-        data, label = _compute(
+        data, label, normalization = _compute(
             eq,
             name,
             grid,
             component=component,
+            norm_name=norm_name,
         )
     else:
         field = kwargs.pop("field", None)
@@ -676,16 +701,15 @@ def plot_2d(
         data = data.reshape((grid.num_theta, grid.num_rho, grid.num_zeta), order="F")
 
         label = r"$\mathbf{B} \cdot \hat{n} ~(\mathrm{T})$"
+        normalization = 1
+        if norm_F:
+            norm_data, _, _ = _compute(eq, norm_name, grid, reshape=False)
+            normalization = np.nanmean(np.abs(norm_data))
+            data = data / normalization  # normalize
 
     fig, ax = _format_ax(ax, figsize=kwargs.pop("figsize", None))
     divider = make_axes_locatable(ax)
 
-    if norm_F:
-        # normalize force by B pressure gradient
-        norm_name = kwargs.pop("norm_name", "<|grad(|B|^2)|/2mu0>_vol")
-        norm_data, _ = _compute(eq, norm_name, grid, reshape=False)
-        data = data / np.nanmean(np.abs(norm_data))  # normalize
-
     # reshape data to 2D
     if 0 in plot_axes:
         if 1 in plot_axes:  # rho & theta
@@ -756,10 +780,7 @@ def plot_2d(
         name: data,
     }
 
-    if norm_F:
-        plot_data["normalization"] = np.nanmean(np.abs(norm_data))
-    else:
-        plot_data["normalization"] = 1
+    plot_data["normalization"] = normalization
     if return_data:
         return fig, ax, plot_data
 
@@ -908,7 +929,7 @@ def plot_3d(
     showscale = kwargs.pop("showscale", True)
 
     if name != "B*n":
-        data, label = _compute(
+        data, label, _ = _compute(
             eq,
             name,
             grid,
@@ -1175,8 +1196,15 @@ def plot_fsa(  # noqa: C901
             # surface average we have the recipe to compute in data_index is the
             # desired surface average.
             name = "<" + name + ">"
-    values, ylabel = _compute(
-        eq, name, grid, kwargs.pop("component", None), reshape=False
+    # normalize force by B pressure gradient
+    norm_name = kwargs.pop("norm_name", "<|grad(|B|^2)|/2mu0>_vol") if norm_F else None
+    values, ylabel, normalization = _compute(
+        eq,
+        name,
+        grid,
+        kwargs.pop("component", None),
+        reshape=False,
+        norm_name=norm_name,
     )
     ylabel = ylabel.split("~")
     if (
@@ -1232,11 +1260,6 @@ def plot_fsa(  # noqa: C901
         values = np.where(is_nan, np.nan, averages)
         plot_data_ylabel_key = f"<{name}>_fsa"
 
-    if norm_F:
-        # normalize force by B pressure gradient
-        norm_name = kwargs.pop("norm_name", "<|grad(|B|^2)|/2mu0>_vol")
-        norm_data = _compute(eq, norm_name, grid, reshape=False)[0]
-        values = values / np.nanmean(np.abs(norm_data))  # normalize
     if log:
         values = np.abs(values)  # ensure data is positive for log plot
         ax.semilogy(rho, values, label=label, color=linecolor, ls=ls, lw=lw)
@@ -1265,10 +1288,7 @@ def plot_fsa(  # noqa: C901
         ax.legend()
 
     plot_data = {"rho": rho, plot_data_ylabel_key: values}
-    if norm_F:
-        plot_data["normalization"] = np.nanmean(np.abs(norm_data))
-    else:
-        plot_data["normalization"] = 1
+    plot_data["normalization"] = normalization
 
     if return_data:
         return fig, ax, plot_data
@@ -1383,12 +1403,16 @@ def plot_section(
     rows = np.floor(np.sqrt(nphi)).astype(int)
     cols = np.ceil(nphi / rows).astype(int)
 
-    data, label = _compute(eq, name, grid, kwargs.pop("component", None), reshape=False)
-    if norm_F:
-        # normalize force by B pressure gradient
-        norm_name = kwargs.pop("norm_name", "<|grad(|B|^2)|/2mu0>_vol")
-        norm_data, _ = _compute(eq, norm_name, grid, reshape=False)
-        data = data / np.nanmean(np.abs(norm_data))  # normalize
+    # normalize force by B pressure gradient
+    norm_name = kwargs.pop("norm_name", "<|grad(|B|^2)|/2mu0>_vol") if norm_F else None
+    data, label, normalization = _compute(
+        eq,
+        name,
+        grid,
+        kwargs.pop("component", None),
+        reshape=False,
+        norm_name=norm_name,
+    )
 
     figw = 5 * cols
     figh = 5 * rows
@@ -1480,10 +1504,7 @@ def plot_section(
     _set_tight_layout(fig)
 
     plot_data = {"R": R, "Z": Z, name: data}
-    if norm_F:
-        plot_data["normalization"] = np.nanmean(np.abs(norm_data))
-    else:
-        plot_data["normalization"] = 1
+    plot_data["normalization"] = normalization
 
     if return_data:
         return fig, ax, plot_data
@@ -2424,9 +2445,7 @@ def plot_boozer_modes(  # noqa: C901
     xlabel_fontsize = kwargs.pop("xlabel_fontsize", None)
     ylabel_fontsize = kwargs.pop("ylabel_fontsize", None)
 
-    basis = get_transforms(
-        "|B|_mn", obj=eq, grid=Grid(np.array([])), M_booz=M_booz, N_booz=N_booz
-    )["B"].basis
+    basis = DoubleFourierSeries(M=M_booz, N=N_booz, NFP=eq.NFP, sym=eq.R_basis.sym)
     if helicity:
         matrix, modes, symidx = ptolemy_linear_transform(
             basis.modes, helicity=helicity, NFP=eq.NFP
@@ -2640,9 +2659,14 @@ def plot_boozer_surface(
             data = thing.compute(
                 "|B|_mn", grid=grid_compute, M_booz=M_booz, N_booz=N_booz
             )
-        B_transform = get_transforms(
-            "|B|_mn", obj=thing, grid=grid_plot, M_booz=M_booz, N_booz=N_booz
-        )["B"]
+        # only the Boozer basis is needed here, so skip building the R, Z, lambda
+        # transforms and the pseudoinverses that get_transforms would make
+        B_transform = Transform(
+            grid_plot,
+            DoubleFourierSeries(
+                M=M_booz, N=N_booz, NFP=thing.NFP, sym=thing.R_basis.sym
+            ),
+        )
         B = B_transform.transform(data["|B|_mn"]).reshape(
             (grid_plot.num_theta, grid_plot.num_zeta), order="F"
         )
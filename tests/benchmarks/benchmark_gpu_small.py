@@ -44,6 +44,7 @@ def test_build_transform_fft_lowres(benchmark):
         basis = FourierZernikeBasis(L=L, M=M, N=N)
         transf = Transform(grid, basis, method="fft", build=False)
         transf.build()
+        jax.block_until_ready(transf.matrices)
 
     benchmark.pedantic(build, setup=setup, iterations=1, rounds=50)
 
@@ -63,6 +64,7 @@ def test_build_transform_fft_midres(benchmark):
         basis = FourierZernikeBasis(L=L, M=M, N=N)
         transf = Transform(grid, basis, method="fft", build=False)
         transf.build()
+        jax.block_until_ready(transf.matrices)
 
     benchmark.pedantic(build, setup=setup, iterations=1, rounds=50)
 
@@ -82,6 +84,7 @@ def test_build_transform_fft_highres(benchmark):
         basis = FourierZernikeBasis(L=L, M=M, N=N)
         transf = Transform(grid, basis, method="fft", build=False)
         transf.build()
+        jax.block_until_ready(transf.matrices)
 
     benchmark.pedantic(build, setup=setup, iterations=1, rounds=50)
 
@@ -1191,10 +1191,6 @@ class TestBootstrapObjectives:
         data = eq.compute(["<J*B>", "<J*B> Redl"], grid=grid, helicity=helicity)
         integrand = (data["<J*B>"] - data["<J*B> Redl"]) / (scales["B"] * scales["J"])
         expected = 0.5 * sum(grid.weights * integrand**2) / (4 * np.pi**2)
-        print(
-            "bootstrap objectives for scaled configs:", results, " expected:", expected
-        )
-
         # Results are not perfectly identical because ln(Lambda) is not quite invariant.
         np.testing.assert_allclose(results, expected, rtol=2e-3)
 
@@ -683,9 +683,6 @@ def test_load_and_save_makegrid_coils_groups(tmpdir_factory):
     for i, (cs1, cs2) in enumerate(zip(coilset, coilset2)):
         for j, (c1, c2) in enumerate(zip(cs1, cs2)):
             c3 = coilset_flat[2 * i + j]
-            print(c1)
-            print(c2)
-            print(c3)
             # make sure knots are exactly the same
             np.testing.assert_allclose(
                 c1.knots, c2.knots, err_msg=f"CoilSet {i} Coil {j}"
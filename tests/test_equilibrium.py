@@ -400,10 +400,7 @@ def test_shifted_circle_geometry():
     zeta = np.linspace(-1.0 * np.pi / iotas, 1.0 * np.pi / iotas, N)
     theta_PEST = alpha * np.ones(N, dtype=int) + iotas * zeta
 
-    coords1 = np.zeros((N, 3))
-    coords1[:, 0] = np.sqrt(psi) * np.ones(N, dtype=int)
-    coords1[:, 1] = theta_PEST
-    coords1[:, 2] = zeta
+    coords1 = np.column_stack([np.full(N, np.sqrt(psi)), theta_PEST, zeta])
 
     # Creating a grid along a field line
     c1 = eq.compute_theta_coords(coords1)
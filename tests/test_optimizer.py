@@ -835,7 +835,6 @@ def test_auglag():
         maxiter=None,
         options={"initial_multipliers": "least_squares"},
     )
-    print(out1["active_mask"])
     out2 = lsq_auglag(
         vecfun,
         x0,
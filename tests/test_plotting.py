@@ -5,6 +5,7 @@ import warnings
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
+from matplotlib.figure import Figure
 from scipy.interpolate import interp1d
 
 from desc.basis import (
@@ -67,6 +68,15 @@ def test_kwarg_future_warning(DummyStellarator):
     return None
 
 
+@pytest.mark.unit
+def test_unknown_norm_name(DummyStellarator):
+    """Test that an unrecognized normalization quantity throws an error."""
+    eq = load(load_from=str(DummyStellarator["output_path"]))
+    with pytest.raises(ValueError, match="not_a_quantity"):
+        fig, ax = plot_fsa(eq, "|F|", norm_F=True, norm_name="not_a_quantity")
+    return None
+
+
 class TestPlot1D:
     """Tests for plot_1d."""
 
@@ -139,6 +149,18 @@ class TestPlot1D:
         fig, ax = plot_1d(surf, "curvature_H_rho", grid=LinearGrid(M=50))
         return fig
 
+    @pytest.mark.unit
+    def test_1d_given_ax_no_pyplot(self):
+        """Test that plotting to an axis made without pyplot returns its figure."""
+        fig = Figure()
+        ax = fig.subplots()
+        num_figs = len(plt.get_fignums())
+        fig_out, _ = plot_1d(FourierXYZCurve([0, 10, 1]), "curvature", ax=ax)
+        assert fig_out is fig
+        # the figure was never registered with pyplot, so there is nothing to close
+        assert len(plt.get_fignums()) == num_figs
+        return None
+
 
 class TestPlot2D:
     """Tests for plot_2d."""
@@ -397,6 +419,21 @@ class TestPlotFSA:
         ax.set_ylim([1e-6, 1e-3])
         return fig
 
+    @pytest.mark.unit
+    def test_fsa_F_normalized_vector(self):
+        """Test that a vector normalization quantity is reduced to its norm."""
+        eq = get("DSHAPE_CURRENT")
+        fig, ax, data = plot_fsa(
+            eq, "|F|", norm_F=True, norm_name="B", return_data=True
+        )
+        fig, ax, data_mag = plot_fsa(
+            eq, "|F|", norm_F=True, norm_name="|B|", return_data=True
+        )
+        assert data.keys() == data_mag.keys()
+        for key in data:
+            np.testing.assert_allclose(data[key], data_mag[key], err_msg=key)
+        return None
+
 
 class TestPlotSection:
     """Tests for plot_section."""
@@ -146,6 +146,7 @@ def test_compute_d_well():
             np.nonzero(np.sign(d_well) != np.sign(d_well_vmec))[0].size <= MAX_SIGN_DIFF
         )
         assert_all_close(d_well, d_well_vmec, rho, rho_range, rtol, atol)
+        return rho, d_well, d_well_vmec
 
     test(
         desc.examples.get("DSHAPE_CURRENT"),
@@ -153,24 +154,15 @@ def test_compute_d_well():
         (0.3, 0.9),
         rtol=1e-1,
     )
-    test(
+    # compute once and check the remaining radial ranges on the same data
+    rho, d_well, d_well_vmec = test(
         desc.examples.get("HELIOTRON"),
         ".//tests//inputs//wout_HELIOTRON.nc",
         (0.01, 0.45),
         rtol=1.75e-1,
     )
-    test(
-        desc.examples.get("HELIOTRON"),
-        ".//tests//inputs//wout_HELIOTRON.nc",
-        (0.45, 0.6),
-        atol=7.2e-1,
-    )
-    test(
-        desc.examples.get("HELIOTRON"),
-        ".//tests//inputs//wout_HELIOTRON.nc",
-        (0.6, 0.99),
-        rtol=2e-2,
-    )
+    assert_all_close(d_well, d_well_vmec, rho, (0.45, 0.6), atol=7.2e-1)
+    assert_all_close(d_well, d_well_vmec, rho, (0.6, 0.99), rtol=2e-2)
 
 
 @pytest.mark.unit
@@ -186,6 +178,7 @@ def test_compute_d_geodesic():
             d_geodesic[bool(grid.axis.size) :] <= 0
         ), "D_geodesic should always have a destabilizing effect."
         assert_all_close(d_geodesic, d_geodesic_vmec, rho, rho_range, rtol, atol)
+        return rho, d_geodesic, d_geodesic_vmec
 
     test(
         desc.examples.get("DSHAPE_CURRENT"),
@@ -193,18 +186,13 @@ def test_compute_d_geodesic():
         (0.3, 0.9),
         rtol=1e-1,
     )
-    test(
+    rho, d_geodesic, d_geodesic_vmec = test(
         desc.examples.get("HELIOTRON"),
         ".//tests//inputs//wout_HELIOTRON.nc",
         (0.15, 0.825),
         rtol=1.2e-1,
     )
-    test(
-        desc.examples.get("HELIOTRON"),
-        ".//tests//inputs//wout_HELIOTRON.nc",
-        (0.85, 0.95),
-        atol=1.2e-1,
-    )
+    assert_all_close(d_geodesic, d_geodesic_vmec, rho, (0.85, 0.95), atol=1.2e-1)
 
 
 @pytest.mark.unit
@@ -222,6 +210,7 @@ def test_compute_d_mercier():
             <= MAX_SIGN_DIFF
         )
         assert_all_close(d_mercier, d_mercier_vmec, rho, rho_range, rtol, atol)
+        return rho, d_mercier, d_mercier_vmec
 
     test(
         desc.examples.get("DSHAPE_CURRENT"),
@@ -230,18 +219,13 @@ def test_compute_d_mercier():
         rtol=1e-1,
         atol=1e-2,
     )
-    test(
+    rho, d_mercier, d_mercier_vmec = test(
         desc.examples.get("HELIOTRON"),
         ".//tests//inputs//wout_HELIOTRON.nc",
         (0.1, 0.325),
         rtol=1.3e-1,
     )
-    test(
-        desc.examples.get("HELIOTRON"),
-        ".//tests//inputs//wout_HELIOTRON.nc",
-        (0.325, 0.95),
-        rtol=5e-2,
-    )
+    assert_all_close(d_mercier, d_mercier_vmec, rho, (0.325, 0.95), rtol=5e-2)
 
 
 @pytest.mark.unit
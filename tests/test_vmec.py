@@ -67,10 +67,6 @@ class TestVMECIO:
 
         m_1, n_1, x = ptolemy_identity_fwd(m_0, n_0, s, c)
 
-        print(m_1)
-        print(n_1)
-        print(x)
-
         #  a1*sin(t+z)  # noqa: E800
         # = a1*sin(t)*cos(z) + a1*cos(t)*sin(z) # noqa: E800
 